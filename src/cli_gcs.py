@@ -1,25 +1,27 @@
 #!/usr/bin/env python3
 
 import time
+START_TIME = time.perf_counter()  # Origin for --profile-startup, taken before the other imports
+
 import logging
 import signal
-from pymavlink import mavutil
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/ground_station.log'),
-        logging.StreamHandler()
-    ]
-)
+
+try:
+    from src.startup import StartupProfiler, configure_logging, lazy_import, load_mavlink, parse_args
+except ImportError:  # Run as a script from src/
+    from startup import StartupProfiler, configure_logging, lazy_import, load_mavlink, parse_args
+
+# pymavlink is only loaded once the ground station is created, see load_mavlink()
+mavutil = lazy_import('pymavlink.mavutil')
+
 logger = logging.getLogger(__name__)
 
 
 class GroundStation:
-    def __init__(self):
+    def __init__(self, dialect='common', profiler=None):
         logger.info("Initializing Ground Station...")
+        self.profiler = profiler or StartupProfiler()
+        load_mavlink(mavutil, dialect, self.profiler)
 
         self.SYSTEM_ID = 255      # GCS system ID
         self.COMPONENT_ID = 26   # MAV_COMP_ID_USER2
@@ -29,8 +31,9 @@ class GroundStation:
             'udpin:localhost:14551',
             source_system=self.SYSTEM_ID,
             source_component=self.COMPONENT_ID,
-            dialect='common'
+            dialect=dialect
         )
+        self.profiler.mark("connection open")
 
         # Define supported commands and their IDs
         self.commands = {
@@ -126,6 +129,8 @@ class GroundStation:
         if not self.wait_heartbeat():  # Wait for first heartbeat before sending commands
             logger.error("No heartbeat received, exiting...")
             return
+        self.profiler.mark("first heartbeat")
+        self.profiler.report()
 
         logger.info("Heartbeat received, you can start sending commands.")
         try:
@@ -159,5 +164,12 @@ class GroundStation:
 
 
 if __name__ == "__main__":
-    gcs = GroundStation()
+    args = parse_args("Command line ground station")
+    profiler = StartupProfiler(enabled=args.profile_startup, start_time=START_TIME)
+    profiler.mark("imports and argument parsing")
+
+    configure_logging('logs/ground_station.log', '%(asctime)s - %(levelname)s - %(message)s')
+    profiler.mark("logging setup")
+
+    gcs = GroundStation(dialect=args.dialect, profiler=profiler)
     gcs.run()
@@ -1,25 +1,27 @@
 #!/usr/bin/env python3
 
 import time
+START_TIME = time.perf_counter()  # Origin for --profile-startup, taken before the other imports
+
 import logging
 import signal
-from pymavlink import mavutil
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler('logs/mavlink_node.log'),
-        logging.StreamHandler()
-    ]
-)
+
+try:
+    from src.startup import StartupProfiler, configure_logging, lazy_import, load_mavlink, parse_args
+except ImportError:  # Run as a script from src/
+    from startup import StartupProfiler, configure_logging, lazy_import, load_mavlink, parse_args
+
+# pymavlink is only loaded once the node is created, see load_mavlink()
+mavutil = lazy_import('pymavlink.mavutil')
+
 logger = logging.getLogger(__name__)
 
 
 class MAVLinkNode:
-    def __init__(self):
+    def __init__(self, dialect='common', profiler=None):
         logger.info("Initializing MAVLink Node...")
+        self.profiler = profiler or StartupProfiler()
+        load_mavlink(mavutil, dialect, self.profiler)
 
         self.SYSTEM_ID = 1
         self.COMPONENT_ID = 25  # MAV_COMP_ID_USER1
@@ -29,8 +31,9 @@ class MAVLinkNode:
             'udpout:localhost:14551',
             source_system=self.SYSTEM_ID,
             source_component=self.COMPONENT_ID,
-            dialect='common'
+            dialect=dialect
         )
+        self.profiler.mark("connection open")
 
         # Define supported commands and their IDs
         self.commands = {
@@ -138,6 +141,9 @@ class MAVLinkNode:
         try:
             while True:
                 self.send_heartbeat()
+                if not self.profiler.reported:
+                    self.profiler.mark("first heartbeat")
+                    self.profiler.report()
 
                 # Check for incoming messages
                 msg = self.master.recv_match(blocking=False)
@@ -153,5 +159,12 @@ class MAVLinkNode:
 
 
 if __name__ == "__main__":
-    node = MAVLinkNode()
+    args = parse_args("MAVLink custom component node")
+    profiler = StartupProfiler(enabled=args.profile_startup, start_time=START_TIME)
+    profiler.mark("imports and argument parsing")
+
+    configure_logging('logs/mavlink_node.log', '%(asctime)s [%(levelname)s] %(message)s')
+    profiler.mark("logging setup")
+
+    node = MAVLinkNode(dialect=args.dialect, profiler=profiler)
     node.run()
@@ -3,11 +3,6 @@
 from pymavlink import mavutil
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 def send_command_long(master, target_system, target_component, command, param1=0, param2=0, param3=0, param4=0, param5=0, param6=0, param7=0):
@@ -36,6 +31,12 @@ def send_command_long(master, target_system, target_component, command, param1=0
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s'
+    )
+
     # Define the target system and component IDs
     TARGET_SYSTEM = 1
     TARGET_COMPONENT = 25
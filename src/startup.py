@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+import time
+import argparse
+import importlib.util
+import logging
+import os
+import pkgutil
+import sys
+
+DIALECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dialects')
+TRIMMED_DIALECT = 'scan_node'  # Bundled dialect with only the messages the components exchange
+
+# Full dialect mavutil imports when loaded if it is installed; nothing here needs it
+ALL_DIALECT_MODULE = 'pymavlink.dialects.v10.all'
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(description):
+    """Parse the command line options shared by the node and ground station"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--dialect', default='common', choices=available_dialects(), metavar='DIALECT',
+                        help=f"MAVLink dialect to load, e.g. '{TRIMMED_DIALECT}' for the bundled trimmed dialect")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="Log where startup time goes before the first heartbeat")
+    return parser.parse_args()
+
+
+def available_dialects():
+    """Dialects that can be loaded without generating them: pymavlink's own and the trimmed one"""
+    package = importlib.import_module(dialect_package())
+    bundled = {info.name for info in pkgutil.iter_modules(package.__path__) if not info.ispkg}
+    return sorted(bundled | {TRIMMED_DIALECT})
+
+
+def configure_logging(log_file, log_format):
+    """Send log output to the console and the given log file"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def _load_lazily(spec):
+    """Create a module from spec whose code only runs on first attribute access"""
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    loader.exec_module(module)
+    return module
+
+
+def lazy_import(name):
+    """Import a module, deferring execution of its code until it is first used"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    return _load_lazily(spec)
+
+
+def resolve(module):
+    """Finish loading a module returned by lazy_import()"""
+    module.__dict__  # Any attribute access runs the deferred module code
+    return module
+
+
+def register_trimmed_dialect():
+    """Expose the bundled trimmed dialect to pymavlink as pymavlink.dialects.<version>.scan_node"""
+    for version in ('v10', 'v20'):
+        name = f'pymavlink.dialects.{version}.{TRIMMED_DIALECT}'
+        if name in sys.modules:
+            continue
+        path = os.path.join(DIALECT_DIR, f'{TRIMMED_DIALECT}_{version}.py')
+        package = importlib.import_module(f'pymavlink.dialects.{version}')
+        module = _load_lazily(importlib.util.spec_from_file_location(name, path))
+        # set_dialect() resolves the module as an attribute of its package
+        setattr(package, TRIMMED_DIALECT, module)
+
+
+def dialect_package():
+    """Package pymavlink's set_dialect() imports dialects from for the selected wire protocol"""
+    version = 'v20' if 'MAVLINK20' in os.environ else 'v10'
+    return f'pymavlink.dialects.{version}'
+
+
+def dialect_module_name(dialect):
+    """Name of the module pymavlink's set_dialect() imports for the given dialect"""
+    return f'{dialect_package()}.{dialect}'
+
+
+def load_mavlink(mavutil, dialect, profiler):
+    """Load the dialect, then finish the deferred pymavlink import, timing each step"""
+    if dialect == TRIMMED_DIALECT:
+        register_trimmed_dialect()
+    try:
+        resolve(importlib.import_module(dialect_module_name(dialect)))
+        profiler.mark(f"dialect load ({dialect})")
+    except ImportError:
+        # Not bundled with pymavlink, so mavutil generates and loads it when selected
+        profiler.mark(f"dialect load ({dialect}, deferred to mavutil)")
+
+    # While mavutil is imported, have it select the dialect loaded above instead of the
+    # default "all", and skip its import of "all", which it treats as optional
+    previous_dialect = os.environ.get('MAVLINK_DIALECT')
+    block_all = ALL_DIALECT_MODULE not in sys.modules
+    os.environ['MAVLINK_DIALECT'] = dialect
+    if block_all:
+        sys.modules[ALL_DIALECT_MODULE] = None
+    try:
+        resolve(mavutil)
+    finally:
+        if previous_dialect is None:
+            os.environ.pop('MAVLINK_DIALECT', None)
+        else:
+            os.environ['MAVLINK_DIALECT'] = previous_dialect
+        if block_all and sys.modules.get(ALL_DIALECT_MODULE, False) is None:
+            del sys.modules[ALL_DIALECT_MODULE]
+    profiler.mark("pymavlink import")
+
+
+class StartupProfiler:
+    """Record how long each startup phase takes before the first heartbeat"""
+
+    def __init__(self, enabled=False, start_time=None):
+        self.enabled = enabled
+        self.phases = []
+        self.reported = False
+        # Scripts pass the time.perf_counter() taken on their first line
+        self._last_mark = time.perf_counter() if start_time is None else start_time
+
+    def mark(self, phase):
+        """Record the time since the previous mark as the named phase"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def report(self):
+        """Log the recorded phases once, if profiling is enabled"""
+        if self.reported:
+            return
+        self.reported = True
+        if not self.enabled:
+            return
+
+        total = sum(duration for _, duration in self.phases)
+        logger.info("Startup profile (time before first heartbeat):")
+        for phase, duration in self.phases:
+            share = 100 * duration / total if total else 0
+            logger.info(f"  {phase:<32} {duration * 1000:8.1f} ms {share:5.1f}%")
+        logger.info(f"  {'total':<32} {total * 1000:8.1f} ms")
@@ -18,7 +18,9 @@ mock_mavutil.mavlink.MAV_COMP_ID_USER1 = 25
 sys.modules['mavutil'] = mock_mavutil
 sys.modules['pymavlink.mavutil'] = mock_mavutil
 
+from src import cli_gcs
 from src.cli_gcs import GroundStation
+from src.startup import StartupProfiler, TRIMMED_DIALECT
 
 
 class TestGroundStation(unittest.TestCase):
@@ -82,6 +84,16 @@ class TestGroundStation(unittest.TestCase):
             0, 0, 0, 0, 0
         )
 
+    def test_dialect_and_profiler_passed_through(self):
+        """Test that the ground station loads the requested dialect and records its startup phases."""
+        profiler = StartupProfiler()
+        gcs = GroundStation(dialect=TRIMMED_DIALECT, profiler=profiler)
+
+        self.assertIs(gcs.profiler, profiler)
+        self.assertEqual([phase for phase, _ in profiler.phases],
+                         [f"dialect load ({TRIMMED_DIALECT})", "pymavlink import", "connection open"])
+        self.assertEqual(cli_gcs.mavutil.mavlink_connection.call_args.kwargs['dialect'], TRIMMED_DIALECT)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,7 +22,9 @@ mock_mavutil.mavlink.MAV_COMP_ID_USER1 = 25
 sys.modules['mavutil'] = mock_mavutil
 sys.modules['pymavlink.mavutil'] = mock_mavutil
 
+from src import mavlink_node
 from src.mavlink_node import MAVLinkNode
+from src.startup import StartupProfiler, TRIMMED_DIALECT
 
 
 class TestMAVLinkNode(unittest.TestCase):
@@ -67,6 +69,16 @@ class TestMAVLinkNode(unittest.TestCase):
             mock_mavutil.mavlink.MAV_RESULT_UNSUPPORTED
         )
 
+    def test_dialect_and_profiler_passed_through(self):
+        """Test that the node loads the requested dialect and records its startup phases."""
+        profiler = StartupProfiler()
+        node = MAVLinkNode(dialect=TRIMMED_DIALECT, profiler=profiler)
+
+        self.assertIs(node.profiler, profiler)
+        self.assertEqual([phase for phase, _ in profiler.phases],
+                         [f"dialect load ({TRIMMED_DIALECT})", "pymavlink import", "connection open"])
+        self.assertEqual(mavlink_node.mavutil.mavlink_connection.call_args.kwargs['dialect'], TRIMMED_DIALECT)
+
 
 if __name__ == '__main__':
     unittest.main()
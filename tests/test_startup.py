@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest.mock import MagicMock, patch
+import contextlib
+import importlib
+import io
+import json
+import subprocess
+import sys
+import os
+import tempfile
+
+import pymavlink
+
+# Ensure consistent test environment
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from src import startup
+from src.startup import (DIALECT_DIR, StartupProfiler, TRIMMED_DIALECT, lazy_import, parse_args,
+                         register_trimmed_dialect, resolve)
+
+# pymavlink release the committed scan_node_v10.py and scan_node_v20.py were generated with
+GENERATED_WITH_PYMAVLINK = '2.4.50'
+
+
+def run_python(code, *args, cwd=None, mavlink_dialect=None):
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    env = {k: v for k, v in os.environ.items() if k not in ('MAVLINK_DIALECT', 'MAVLINK20')}
+    env['PYTHONPATH'] = REPO_ROOT
+    if mavlink_dialect is not None:
+        env['MAVLINK_DIALECT'] = mavlink_dialect
+    result = subprocess.run([sys.executable, '-c', code, *args], cwd=cwd, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+class TestLazyImport(unittest.TestCase):
+    def setUp(self):
+        """Create a throwaway module that records when its code runs."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmpdir.name, 'lazy_probe.py'), 'w') as f:
+            f.write("import os\nos.environ['LAZY_PROBE_LOADED'] = '1'\nVALUE = 42\n")
+        sys.path.insert(0, self.tmpdir.name)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        sys.path.remove(self.tmpdir.name)
+        sys.modules.pop('lazy_probe', None)
+        os.environ.pop('LAZY_PROBE_LOADED', None)
+        self.tmpdir.cleanup()
+
+    def test_module_code_deferred_until_first_use(self):
+        """Test that the module only runs once an attribute is accessed."""
+        module = lazy_import('lazy_probe')
+        self.assertNotIn('LAZY_PROBE_LOADED', os.environ)
+
+        self.assertEqual(module.VALUE, 42)
+        self.assertIn('LAZY_PROBE_LOADED', os.environ)
+
+    def test_resolve_runs_module(self):
+        """Test that resolve() finishes loading a lazy module."""
+        resolve(lazy_import('lazy_probe'))
+        self.assertIn('LAZY_PROBE_LOADED', os.environ)
+
+    def test_existing_module_returned(self):
+        """Test that an already imported module is returned unchanged."""
+        self.assertIs(lazy_import('os'), os)
+
+
+class TestImportSideEffects(unittest.TestCase):
+    def test_scripts_import_without_io_or_pymavlink(self):
+        """Test that importing the node and ground station does no I/O and defers pymavlink."""
+        code = (
+            "import json, logging, sys\n"
+            "import src.mavlink_node, src.cli_gcs\n"
+            "mavutil = sys.modules['pymavlink.mavutil']\n"
+            "print(json.dumps({\n"
+            "    'handlers': len(logging.getLogger().handlers),\n"
+            "    'common': 'pymavlink.dialects.v10.common' in sys.modules,\n"
+            "    'all': 'pymavlink.dialects.v10.all' in sys.modules,\n"
+            "    'mavutil': 'mavlink_connection' in object.__getattribute__(mavutil, '__dict__'),\n"
+            "}))\n"
+        )
+        with tempfile.TemporaryDirectory() as cwd:
+            os.mkdir(os.path.join(cwd, 'logs'))
+            state = run_python(code, cwd=cwd)
+            self.assertEqual(os.listdir(os.path.join(cwd, 'logs')), [])
+
+        self.assertEqual(state['handlers'], 0)
+        self.assertFalse(state['common'])
+        self.assertFalse(state['all'])
+        self.assertFalse(state['mavutil'])
+
+
+class TestLoadMavlink(unittest.TestCase):
+    CODE = (
+        "import importlib, json, os, sys\n"
+        "from src.startup import StartupProfiler, lazy_import, load_mavlink\n"
+        "mavutil = lazy_import('pymavlink.mavutil')\n"
+        "profiler = StartupProfiler()\n"
+        "load_mavlink(mavutil, sys.argv[1], profiler)\n"
+        "state = {\n"
+        "    'phases': [phase for phase, _ in profiler.phases],\n"
+        "    'dialect': mavutil.mavlink.__name__,\n"
+        "    'env': os.environ.get('MAVLINK_DIALECT'),\n"
+        "    'all_skipped': 'pymavlink.dialects.v10.all' not in sys.modules,\n"
+        "}\n"
+        "importlib.import_module('pymavlink.dialects.v10.all')  # Must still be importable\n"
+        "print(json.dumps(state))\n"
+    )
+
+    def check_load(self, dialect, mavlink_dialect=None):
+        """Load the dialect in a fresh interpreter and check the resulting process state."""
+        state = run_python(self.CODE, dialect, mavlink_dialect=mavlink_dialect)
+
+        self.assertEqual(state['phases'], [f"dialect load ({dialect})", "pymavlink import"])
+        self.assertEqual(state['dialect'], f'pymavlink.dialects.v10.{dialect}')
+        self.assertEqual(state['env'], mavlink_dialect)
+        self.assertTrue(state['all_skipped'])
+
+    def test_common_dialect(self):
+        """Test loading the default common dialect."""
+        self.check_load('common')
+
+    def test_trimmed_dialect(self):
+        """Test loading the bundled trimmed dialect."""
+        self.check_load(TRIMMED_DIALECT)
+
+    def test_existing_environment_restored(self):
+        """Test that a MAVLINK_DIALECT set by the caller is left unchanged."""
+        self.check_load(TRIMMED_DIALECT, mavlink_dialect='ardupilotmega')
+
+    def test_unbundled_dialect_marked_deferred(self):
+        """Test that a dialect mavutil has to generate is not timed as loaded."""
+        profiler = StartupProfiler()
+        startup.load_mavlink(MagicMock(), 'not_a_dialect', profiler)
+
+        self.assertEqual([phase for phase, _ in profiler.phases],
+                         ["dialect load (not_a_dialect, deferred to mavutil)", "pymavlink import"])
+
+    def test_in_process_state_restored(self):
+        """Test that loading leaves the environment and module cache as they were."""
+        previous = os.environ.get('MAVLINK_DIALECT')
+        had_all = 'pymavlink.dialects.v10.all' in sys.modules
+
+        startup.load_mavlink(MagicMock(), TRIMMED_DIALECT, StartupProfiler())
+
+        self.assertEqual(os.environ.get('MAVLINK_DIALECT'), previous)
+        self.assertEqual('pymavlink.dialects.v10.all' in sys.modules, had_all)
+
+
+class TestParseArgs(unittest.TestCase):
+    def test_bundled_dialects_accepted(self):
+        """Test that pymavlink's dialects and the trimmed dialect are accepted."""
+        for dialect in ('common', TRIMMED_DIALECT):
+            with patch.object(sys, 'argv', ['prog', '--dialect', dialect, '--profile-startup']):
+                args = parse_args("test")
+            self.assertEqual(args.dialect, dialect)
+            self.assertTrue(args.profile_startup)
+
+    def test_unknown_dialect_rejected(self):
+        """Test that a misspelt dialect is rejected before pymavlink tries to generate it."""
+        with patch.object(sys, 'argv', ['prog', '--dialect', 'comon']), \
+                contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parse_args("test")
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def test_mark_records_phases_in_order(self):
+        """Test that each mark is recorded as a phase."""
+        profiler = StartupProfiler()
+        profiler.mark("first")
+        profiler.mark("second")
+
+        self.assertEqual([phase for phase, _ in profiler.phases], ["first", "second"])
+        self.assertTrue(all(duration >= 0 for _, duration in profiler.phases))
+
+    def test_report_only_logged_once_when_enabled(self):
+        """Test that the report is logged a single time."""
+        profiler = StartupProfiler(enabled=True)
+        profiler.mark("phase")
+
+        with patch.object(startup.logger, 'info') as mock_info:
+            profiler.report()
+            calls = mock_info.call_count
+            profiler.report()
+
+        self.assertGreater(calls, 0)
+        self.assertEqual(mock_info.call_count, calls)
+        self.assertTrue(profiler.reported)
+
+    def test_report_silent_when_disabled(self):
+        """Test that nothing is logged without --profile-startup."""
+        profiler = StartupProfiler()
+        profiler.mark("phase")
+
+        with patch.object(startup.logger, 'info') as mock_info:
+            profiler.report()
+
+        mock_info.assert_not_called()
+        self.assertTrue(profiler.reported)
+
+
+class TestTrimmedDialect(unittest.TestCase):
+    def test_messages_compatible_with_common(self):
+        """Test that the trimmed dialect agrees with the common dialect on the wire."""
+        register_trimmed_dialect()
+        for version in ('v10', 'v20'):
+            trimmed = importlib.import_module(f'pymavlink.dialects.{version}.{TRIMMED_DIALECT}')
+            common = importlib.import_module(f'pymavlink.dialects.{version}.common')
+
+            for msg_id, msg_type in trimmed.mavlink_map.items():
+                self.assertEqual(msg_type.crc_extra, common.mavlink_map[msg_id].crc_extra)
+
+    def test_generated_modules_match_xml(self):
+        """Test that the committed modules define the messages in scan_node.xml as on the wire."""
+        from pymavlink.generator import mavparse
+
+        register_trimmed_dialect()
+        xml = os.path.join(DIALECT_DIR, f'{TRIMMED_DIALECT}.xml')
+        for version, wire_protocol in (('v10', mavparse.PROTOCOL_1_0), ('v20', mavparse.PROTOCOL_2_0)):
+            module = importlib.import_module(f'pymavlink.dialects.{version}.{TRIMMED_DIALECT}')
+            definitions = mavparse.MAVXML(xml, wire_protocol).message
+
+            self.assertEqual(sorted(module.mavlink_map), sorted(msg.id for msg in definitions))
+            for msg in definitions:
+                msg_type = module.mavlink_map[msg.id]
+                self.assertEqual(msg_type.msgname, msg.name)
+                self.assertEqual(msg_type.fieldnames, msg.fieldnames)
+                self.assertEqual(msg_type.fieldtypes, [field.type for field in msg.fields])
+                self.assertEqual(msg_type.array_lengths, [field.array_length for field in msg.fields])
+                self.assertEqual(msg_type.crc_extra, msg.crc_extra)
+
+    @unittest.skipUnless(pymavlink.__version__ == GENERATED_WITH_PYMAVLINK,
+                         f"generator output is only compared with pymavlink {GENERATED_WITH_PYMAVLINK}")
+    def test_generated_modules_up_to_date(self):
+        """Test that the committed modules match mavgen output for scan_node.xml."""
+        from pymavlink.generator import mavgen
+
+        xml = os.path.join(DIALECT_DIR, f'{TRIMMED_DIALECT}.xml')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for version, wire_protocol in (('v10', '1.0'), ('v20', '2.0')):
+                output = os.path.join(tmpdir, f'{TRIMMED_DIALECT}_{version}.py')
+                with contextlib.redirect_stdout(io.StringIO()):
+                    mavgen.mavgen(mavgen.Opts(output, wire_protocol=wire_protocol, language='Python3'), [xml])
+
+                with open(output) as generated, open(os.path.join(DIALECT_DIR, os.path.basename(output))) as committed:
+                    self.assertEqual(generated.read(), committed.read(),
+                                     f"{os.path.basename(output)} is stale, regenerate it from {TRIMMED_DIALECT}.xml")
+
+    def test_round_trip(self):
+        """Test that a STATUSTEXT encoded with the trimmed dialect decodes."""
+        register_trimmed_dialect()
+        trimmed = importlib.import_module(f'pymavlink.dialects.v10.{TRIMMED_DIALECT}')
+
+        mav = trimmed.MAVLink(None, srcSystem=1, srcComponent=25)
+        buf = mav.statustext_encode(trimmed.MAV_SEVERITY_INFO, b"Scan complete").pack(mav)
+        msg = trimmed.MAVLink(None).decode(bytearray(buf))
+
+        self.assertEqual(msg.get_type(), 'STATUSTEXT')
+        self.assertEqual(msg.text, "Scan complete")
+
+
+if __name__ == '__main__':
+    unittest.main()